@@ -1,14 +1,52 @@
 from django.contrib import admin
 from .models import CustomUser, Country, Currency, State, City, TimeZone, TaxSetting
 
+
+def related_filter(*related):
+    """
+    A RelatedFieldListFilter whose choices are loaded with select_related(*related),
+    for models whose __str__ follows foreign keys (State, City).
+    """
+    class SelectRelatedFieldListFilter(admin.RelatedFieldListFilter):
+        def field_choices(self, field, request, model_admin):
+            choices = field.related_model._default_manager.select_related(*related)
+            ordering = self.field_admin_ordering(field, request, model_admin)
+            if ordering:
+                choices = choices.order_by(*ordering)
+            return [(obj.pk, str(obj)) for obj in choices]
+    return SelectRelatedFieldListFilter
+
+
+def selected_filter(*related):
+    """
+    A RelatedFieldListFilter for relations with too many rows to list (vendors):
+    the sidebar offers only "All" and the choice currently filtered on, which
+    is reached from a link or the changelist search instead.
+    """
+    class SelectedFieldListFilter(admin.RelatedFieldListFilter):
+        include_empty_choice = False
+
+        def field_choices(self, field, request, model_admin):
+            pks = [pk for pk in self.lookup_val or () if pk.isdigit()]
+            if not pks:
+                return []
+            choices = field.related_model._default_manager.filter(pk__in=pks).select_related(*related)
+            return [(obj.pk, str(obj)) for obj in choices]
+
+        def has_output(self):
+            return bool(self.lookup_choices)
+    return SelectedFieldListFilter
+
 @admin.register(CustomUser)
 class CustomUserAdmin(admin.ModelAdmin):
     list_display = ('username', 'email', 'user_type', 'country', 'state', 'city', 'timezone')
-    list_filter = ('user_type', 'country', 'state', 'city')
+    list_filter = ('user_type', 'country', ('state', related_filter('country')), ('city', related_filter('state')))
+    list_select_related = ('country', 'state__country', 'city__state', 'timezone')
 
 @admin.register(Country)
 class CountryAdmin(admin.ModelAdmin):
     list_display = ('name', 'code', 'currency')
+    list_select_related = ('currency',)
 
 @admin.register(Currency)
 class CurrencyAdmin(admin.ModelAdmin):
@@ -17,10 +55,12 @@ class CurrencyAdmin(admin.ModelAdmin):
 @admin.register(State)
 class StateAdmin(admin.ModelAdmin):
     list_display = ('name', 'country', 'code')
+    list_select_related = ('country',)
 
 @admin.register(City)
 class CityAdmin(admin.ModelAdmin):
     list_display = ('name', 'state')
+    list_select_related = ('state__country',)
 
 @admin.register(TimeZone)
 class TimeZoneAdmin(admin.ModelAdmin):
@@ -29,3 +69,4 @@ class TimeZoneAdmin(admin.ModelAdmin):
 @admin.register(TaxSetting)
 class TaxSettingAdmin(admin.ModelAdmin):
     list_display = ('name', 'rate', 'country', 'state')
+    list_select_related = ('country', 'state__country')
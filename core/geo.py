@@ -0,0 +1,106 @@
+# core/geo.py
+
+import threading
+import time
+from collections import namedtuple
+
+from django.core.cache import cache
+
+from .models import City, Country, Currency, State, TimeZone
+
+VERSION_KEY = 'geo:version'
+
+CurrencyNode = namedtuple('CurrencyNode', 'pk name code')
+CountryNode = namedtuple('CountryNode', 'pk name code currency_id')
+StateNode = namedtuple('StateNode', 'pk name code country_id')
+CityNode = namedtuple('CityNode', 'pk name state_id')
+TimeZoneNode = namedtuple('TimeZoneNode', 'pk name timezone_value')
+# A place resolved up the hierarchy; any level may be None.
+Region = namedtuple('Region', 'city_id state_id country_id')
+
+
+def geo_version():
+    return cache.get_or_set(VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_geo(*args, **kwargs):
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+class GeoIndex:
+    """
+    In-process copy of the (small) geography tables: countries, states,
+    cities, currencies and time zones, with the links between them. Walking
+    City -> State -> Country costs dict lookups instead of a query per hop.
+
+    Loaded on first use and reloaded when the version in the cache moves,
+    which any save or delete of those models does (core/signals.py), so
+    every process sees changes on its next lookup.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+
+    def load(self):
+        self.currencies = {row[0]: CurrencyNode(*row) for row in Currency.objects.values_list('pk', 'name', 'code')}
+        self.countries = {
+            row[0]: CountryNode(*row) for row in Country.objects.values_list('pk', 'name', 'code', 'currency_id')
+        }
+        self.states = {row[0]: StateNode(*row) for row in State.objects.values_list('pk', 'name', 'code', 'country_id')}
+        self.cities = {row[0]: CityNode(*row) for row in City.objects.values_list('pk', 'name', 'state_id')}
+        self.timezones = {
+            row[0]: TimeZoneNode(*row) for row in TimeZone.objects.values_list('pk', 'name', 'timezone_value')
+        }
+        self.states_by_country, self.cities_by_state = {}, {}
+        for state in self.states.values():
+            self.states_by_country.setdefault(state.country_id, []).append(state.pk)
+        for city in self.cities.values():
+            self.cities_by_state.setdefault(city.state_id, []).append(city.pk)
+
+    def fresh(self):
+        version = geo_version()
+        if version != self.version:
+            with self.lock:
+                if version != self.version:
+                    self.load()
+                    self.version = version
+        return self
+
+    def region(self, city=None, state=None, country=None):
+        """
+        The Region of the most specific place given (instances or ids), with
+        the levels above it filled in from the hierarchy.
+        """
+        city_id = getattr(city, 'pk', city)
+        state_id = getattr(state, 'pk', state)
+        country_id = getattr(country, 'pk', country)
+        if city_id in self.cities:
+            state_id = self.cities[city_id].state_id
+        else:
+            city_id = None
+        if state_id in self.states:
+            country_id = self.states[state_id].country_id
+        else:
+            state_id = None
+        if country_id not in self.countries:
+            country_id = None
+        return Region(city_id, state_id, country_id)
+
+    def currency_of(self, country_id):
+        country = self.countries.get(country_id)
+        return self.currencies.get(country.currency_id) if country else None
+
+    def label(self, region):
+        """'City, State, Country' for as much of the region as is known."""
+        parts = [
+            self.cities[region.city_id].name if region.city_id else None,
+            self.states[region.state_id].name if region.state_id else None,
+            self.countries[region.country_id].name if region.country_id else None,
+        ]
+        return ', '.join(part for part in parts if part)
+
+
+geo = GeoIndex()
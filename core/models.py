@@ -51,14 +51,19 @@ class State(models.Model):
     code = models.CharField(max_length=5)
 
     def __str__(self):
-        return f"{self.name}, {self.country.name}"
+        # From the geo index rather than a query per state listed.
+        from .geo import geo
+        country = geo.fresh().countries.get(self.country_id)
+        return f"{self.name}, {country.name if country else self.country.name}"
 
 class City(models.Model):
     name = models.CharField(max_length=100)
     state = models.ForeignKey(State, on_delete=models.CASCADE)
 
     def __str__(self):
-        return f"{self.name}, {self.state.name}"
+        from .geo import geo
+        state = geo.fresh().states.get(self.state_id)
+        return f"{self.name}, {state.name if state else self.state.name}"
 
 class TimeZone(models.Model):
     name = models.CharField(max_length=100)
@@ -0,0 +1,10 @@
+# core/signals.py
+
+from django.db.models.signals import post_delete, post_save
+
+from .geo import invalidate_geo
+from .models import City, Country, Currency, State, TimeZone
+
+for model in (Country, State, City, Currency, TimeZone):
+    post_save.connect(invalidate_geo, sender=model, dispatch_uid=f'geo_index_save_{model.__name__}')
+    post_delete.connect(invalidate_geo, sender=model, dispatch_uid=f'geo_index_delete_{model.__name__}')
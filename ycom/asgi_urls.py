@@ -0,0 +1,11 @@
+"""
+URL configuration for the ASGI entry point (ycom/asgi.py): the same site as
+ycom.urls, with the public read pages and API served by async views.
+"""
+from django.urls import include, path
+
+from .urls import urlpatterns as wsgi_urlpatterns
+
+urlpatterns = [
+    path('vendor/', include('vendor.async_urls')),
+] + wsgi_urlpatterns
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -27,6 +28,10 @@ DEBUG = True
 
 ALLOWED_HOSTS = []
 
+# Lets scrapers read /metrics/ without signing in, sent as
+# "Authorization: Bearer <token>". Unset, only staff may read it.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
 
 # Application definition
 
@@ -40,12 +45,13 @@ INSTALLED_APPS = [
     'core',
     'vendor',
     "taggit",
-    
+    'rest_framework',
 ]
 
 MIDDLEWARE = [
+    'vendor.instrumentation.InstrumentationMiddleware',  # first, so it sees every query
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'vendor.middleware.SessionMiddleware',  # skips session writes on read-only views
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -53,7 +59,8 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'ycom.urls'
+# ycom/asgi.py switches to ycom.asgi_urls, which serves the public read views async.
+ROOT_URLCONF = os.environ.get('ROOT_URLCONF', 'ycom.urls')
 
 TEMPLATES = [
     {
@@ -137,6 +144,30 @@ AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
 ]
 SESSION_SAVE_EVERY_REQUEST = True
+
+# Caches: Redis when REDIS_URL is set, a shared file cache when CACHE_DIR is
+# set, per-process memory otherwise.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+elif os.environ.get('CACHE_DIR'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ['CACHE_DIR'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+EVENT_CACHE_TIMEOUT = 600
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -2,8 +2,10 @@
 
 from django.contrib import admin
 from django.urls import path,include
+from vendor.instrumentation import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('vendor/',include('vendor.urls')),
+    path('metrics/', metrics_view, name='metrics'),
 ]